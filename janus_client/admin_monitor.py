@@ -99,11 +99,13 @@ class JanusAdminMonitorClient:
         message_transaction = await self.__transport.send(
             message=full_message,
         )
-        response = await message_transaction.get(
-            matcher=function_matcher,
-            timeout=timeout,
-        )
-        await message_transaction.done()
+        try:
+            response = await message_transaction.get(
+                matcher=function_matcher,
+                timeout=timeout,
+            )
+        finally:
+            await message_transaction.done()
 
         return response
 
@@ -19,9 +19,7 @@ from av import AudioFrame, VideoFrame
 from av.frame import Frame
 from av.packet import Packet
 
-format = "%(asctime)s: %(message)s"
-logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
-logger = logging.getLogger()
+logger = logging.getLogger(__name__)
 
 
 async def async_do_nothing() -> None:
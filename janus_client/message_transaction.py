@@ -1,5 +1,4 @@
 import asyncio
-import uuid
 from typing import Dict, List, Union, Callable
 
 
@@ -52,20 +51,25 @@ def is_subset(dict_1: Dict, dict_2: Dict) -> bool:
 class MessageTransaction:
     __id: str
     __msg_all: List[Dict]
-    __msg_in: asyncio.Queue
+    __msg_waiters: List[asyncio.Future]
 
-    def __init__(self) -> None:
-        self.__id = uuid.uuid4().hex
+    def __init__(self, transaction_id: str) -> None:
+        self.__id = transaction_id
         self.__msg_all = []
-        self.__msg_in = asyncio.Queue()
+        self.__msg_waiters = []
 
     @property
     def id(self) -> str:
         return self.__id
 
     def put_msg(self, message: Dict) -> None:
-        # Queue is never full
-        self.__msg_in.put_nowait(message)
+        # Always save received messages
+        self.__msg_all.append(message)
+
+        # Wake up everyone waiting for a new message
+        for waiter in self.__msg_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
 
     async def get(
         self,
@@ -86,21 +90,22 @@ class MessageTransaction:
 
             _matcher = dict_matcher
 
-        # Try to find message in saved messages
-        for msg in self.__msg_all:
-            if _matcher(msg):
-                return msg
-
-        # Wait in queue until a matching message is found
-        msg = await asyncio.wait_for(self.__msg_in.get(), timeout=timeout)
-        # Always save received messages
-        self.__msg_all.append(msg)
-
-        while not _matcher(msg):
-            msg = await asyncio.wait_for(self.__msg_in.get(), timeout=timeout)
-            self.__msg_all.append(msg)
-
-        return msg
+        checked_count = 0
+        while True:
+            # Try to find message in saved messages
+            while checked_count < len(self.__msg_all):
+                msg = self.__msg_all[checked_count]
+                checked_count += 1
+                if _matcher(msg):
+                    return msg
+
+            # Wait until a new message is received
+            waiter = asyncio.get_running_loop().create_future()
+            self.__msg_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout=timeout)
+            finally:
+                self.__msg_waiters.remove(waiter)
 
     async def on_done(self) -> None:
         pass
@@ -41,6 +41,11 @@ class JanusPlugin(ABC):
     def id(self) -> int:
         return self.__id
 
+    @property
+    def request_timeout(self) -> float:
+        """Seconds to wait for a reply, taken from the session's transport."""
+        return self.__session.transport.request_timeout
+
     async def attach(self, session: JanusSession):
         if self.__id:
             raise Exception(f"Plugin already attached to session ({self.__session})")
@@ -52,14 +57,16 @@ class JanusPlugin(ABC):
         """Destroy plugin handle"""
 
         message_transaction = await self.send({"janus": "detach"})
-        await message_transaction.get()
-        await message_transaction.done()
+        try:
+            await message_transaction.get(timeout=self.request_timeout)
+        finally:
+            await message_transaction.done()
         self.__session.detach_plugin(self)
 
     def __sanitize_message(self, message: dict) -> None:
         if "handle_id" in message:
-            logger.warn(
-                f"Should not set handle_id ({message['handle_id']}). Overriding."
+            logger.warning(
+                "Should not set handle_id (%s). Overriding.", message["handle_id"]
             )
             del message["handle_id"]
 
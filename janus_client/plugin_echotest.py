@@ -122,8 +122,10 @@ class JanusEchoTestPlugin(JanusPlugin):
         }
 
         message_transaction = await self.send(message)
-        response = await message_transaction.get()
-        await message_transaction.done()
+        try:
+            response = await message_transaction.get(timeout=self.request_timeout)
+        finally:
+            await message_transaction.done()
 
         # Immediately apply answer if it's found
         if "jsep" in response:
@@ -140,8 +140,12 @@ class JanusVideoCallPlugin(JanusPlugin):
         message_transaction = await self.send(
             message=full_message,
         )
-        response = await message_transaction.get(matcher=function_matcher)
-        await message_transaction.done()
+        try:
+            response = await message_transaction.get(
+                matcher=function_matcher, timeout=self.request_timeout
+            )
+        finally:
+            await message_transaction.done()
 
         return response
 
@@ -137,8 +137,12 @@ class JanusVideoRoomPlugin(JanusPlugin):
         message_transaction = await self.send(
             message=full_message,
         )
-        response = await message_transaction.get(matcher=function_matcher, timeout=15)
-        await message_transaction.done()
+        try:
+            response = await message_transaction.get(
+                matcher=function_matcher, timeout=self.request_timeout
+            )
+        finally:
+            await message_transaction.done()
 
         if is_subset(response, {"janus": "error", "error": {}}):
             raise Exception(f"Janus error: {response}")
@@ -772,8 +776,10 @@ class JanusVideoRoomPlugin(JanusPlugin):
                 },
             }
         )
-        await message_transaction.get()
-        await message_transaction.done()
+        try:
+            await message_transaction.get(timeout=self.request_timeout)
+        finally:
+            await message_transaction.done()
 
     # async def handle_jsep(self, jsep):
     #     logger.info(jsep)
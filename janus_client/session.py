@@ -85,8 +85,13 @@ class JanusSession:
             message_transaction = await self.send(
                 {"janus": "destroy"},
             )
-            await message_transaction.get(matcher={"janus": "success"}, timeout=15)
-            await message_transaction.done()
+            try:
+                await message_transaction.get(
+                    matcher={"janus": "success"},
+                    timeout=self.transport.request_timeout,
+                )
+            finally:
+                await message_transaction.done()
         except Exception as exception:
             logger.error(
                 "".join(
@@ -118,8 +123,8 @@ class JanusSession:
 
     def __sanitize_message(self, message: dict) -> None:
         if "session_id" in message:
-            logger.warn(
-                f"Should not set session_id ({message['session_id']}). Overriding."
+            logger.warning(
+                "Should not set session_id (%s). Overriding.", message["session_id"]
             )
             del message["session_id"]
 
@@ -178,8 +183,12 @@ class JanusSession:
         message_transaction = await self.send(
             {"janus": "attach", "plugin": plugin.name},
         )
-        response = await message_transaction.get(matcher=matcher)
-        await message_transaction.done()
+        try:
+            response = await message_transaction.get(
+                matcher=matcher, timeout=self.transport.request_timeout
+            )
+        finally:
+            await message_transaction.done()
 
         if response["janus"] == "error":
             raise PluginAttachFail(response=response)
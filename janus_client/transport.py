@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 import asyncio
-from typing import TYPE_CHECKING, List, Dict
+import itertools
+import os
+from typing import TYPE_CHECKING, Iterator, List, Dict
 import logging
 
-# import uuid
-import json
+import orjson
 
 from .message_transaction import MessageTransaction
 
@@ -23,13 +24,16 @@ class JanusTransport(ABC):
     __transport_implementation: List[tuple] = []
 
     __base_url: str
-    __api_secret: str
-    __token: str
+    __auth: Dict[str, str]
     __message_transaction: Dict[str, MessageTransaction]
     __sessions: Dict[int, "JanusSession"]
+    __transaction_id_prefix: str
+    __transaction_id_counter: Iterator[int]
     __connect_lock: asyncio.Lock
     connected: bool
     """Must set this property when connected or disconnected"""
+    request_timeout: float
+    """Seconds to wait for the response of a request"""
 
     @abstractmethod
     async def _send(self, message: Dict) -> None:
@@ -47,18 +51,22 @@ class JanusTransport(ABC):
     async def info(self) -> Dict:
         """Get info of Janus server. Will be overridden for HTTP."""
         message_transaction = await self.send({"janus": "info"})
-        response = await message_transaction.get()
-        await message_transaction.done()
-        return response
+        try:
+            return await message_transaction.get(timeout=self.request_timeout)
+        finally:
+            await message_transaction.done()
 
     async def ping(self) -> Dict:
         message_transaction = await self.send(
             {"janus": "ping"},
             # response_handler=lambda res: res if res["janus"] == "pong" else None,
         )
-        response = await message_transaction.get(matcher={"janus": "pong"}, timeout=15)
-        await message_transaction.done()
-        return response
+        try:
+            return await message_transaction.get(
+                matcher={"janus": "pong"}, timeout=self.request_timeout
+            )
+        finally:
+            await message_transaction.done()
 
     async def dispatch_session_created(self, session_id: int) -> None:
         """Override this method to get session created event"""
@@ -69,22 +77,36 @@ class JanusTransport(ABC):
         pass
 
     def __init__(
-        self, base_url: str, api_secret: str = None, token: str = None, **kwargs: dict
+        self,
+        base_url: str,
+        api_secret: str = None,
+        token: str = None,
+        request_timeout: float = 15.0,
+        **kwargs: dict,
     ):
         """Create connection instance
 
         :param base_url: Janus server address
         :param api_secret: (optional) API key for shared static secret authentication
         :param token: (optional) Token for shared token based authentication
+        :param request_timeout: (optional) Seconds to wait for a response
         """
 
         self.__base_url = base_url.rstrip("/")
-        self.__api_secret = api_secret
-        self.__token = token
+        # Authentication fields never change, so add them to every message at once
+        self.__auth = dict()
+        if api_secret is not None:
+            self.__auth["apisecret"] = api_secret
+        if token is not None:
+            self.__auth["token"] = token
         self.__message_transaction = dict()
         self.__sessions = dict()
+        # Transaction IDs only need to be unique within this transport
+        self.__transaction_id_prefix = os.urandom(4).hex()
+        self.__transaction_id_counter = itertools.count()
         self.__connect_lock = asyncio.Lock()
         self.connected = False
+        self.request_timeout = request_timeout
 
     # def __del__(self):
     #     asyncio.run(asyncio.create_task(self.disconnect()))
@@ -93,10 +115,6 @@ class JanusTransport(ABC):
     def base_url(self) -> str:
         return self.__base_url
 
-    # async def put_response(self, transaction_id: int, response: dict) -> None:
-    #     logger.info(f"Received: {response}")
-    #     await self.__transactions[transaction_id].put(response)
-
     async def connect(self) -> None:
         """Initialize resources"""
         async with self.__connect_lock:
@@ -118,8 +136,8 @@ class JanusTransport(ABC):
             raise Exception('Must set "janus" field')
 
         if "transaction" in message:
-            logger.warn(
-                f"Should not set transaction ({message['transaction']}). Overriding."
+            logger.warning(
+                "Should not set transaction (%s). Overriding.", message["transaction"]
             )
             del message["transaction"]
 
@@ -140,7 +158,12 @@ class JanusTransport(ABC):
         self.__sanitize_message(message=message)
 
         # Create transaction
-        message_transaction = MessageTransaction()
+        message_transaction = MessageTransaction(
+            transaction_id=(
+                f"{self.__transaction_id_prefix}"
+                f"{next(self.__transaction_id_counter):x}"
+            )
+        )
         self.__message_transaction[message_transaction.id] = message_transaction
         message["transaction"] = message_transaction.id
 
@@ -151,10 +174,7 @@ class JanusTransport(ABC):
         message_transaction.on_done = message_transaction_on_done
 
         # Authentication
-        if self.__api_secret is not None:
-            message["apisecret"] = self.__api_secret
-        if self.__token is not None:
-            message["token"] = self.__token
+        message.update(self.__auth)
 
         # IDs
         if session_id is not None:
@@ -163,14 +183,26 @@ class JanusTransport(ABC):
             message["handle_id"] = handle_id
 
         # Send the message
-        message_json = json.dumps(message)
-        logger.info(f"Send: {message_json}")
-        await self._send(message=message)
+        # Only serialize the whole message, e.g. SDP offers, when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Send: %s", orjson.dumps(message).decode())
+        else:
+            logger.info(
+                "Send: janus=%s transaction=%s",
+                message["janus"],
+                message["transaction"],
+            )
+        try:
+            await self._send(message=message)
+        except Exception:
+            # Nothing will ever be put into a transaction that failed to send
+            await message_transaction.done()
+            raise
 
         return message_transaction
 
     async def receive(self, response: dict) -> None:
-        logger.info(f"Received: {response}")
+        logger.debug("Received: %s", response)
         # First try transaction handlers
         if "transaction" in response:
             transaction_id = response["transaction"]
@@ -187,19 +219,23 @@ class JanusTransport(ABC):
                 await self.__sessions[session_id].on_receive(response)
             else:
                 logger.warning(
-                    f"Got response for session but session not found."
-                    f"Session ID: {session_id} Unhandeled response: {response}"
+                    "Got response for session but session not found. "
+                    "Session ID: %s Unhandeled response: %s",
+                    session_id,
+                    response,
                 )
         else:
             # No handler found for response
-            logger.info(f"Response dropped: {response}")
+            logger.info("Response dropped: %s", response)
 
     async def create_session(self, session: "JanusSession") -> int:
         """Create Janus Session"""
 
         message_transaction = await self.send({"janus": "create"})
-        response = await message_transaction.get()
-        await message_transaction.done()
+        try:
+            response = await message_transaction.get(timeout=self.request_timeout)
+        finally:
+            await message_transaction.done()
 
         # Extract session ID
         session_id = int(response["data"]["id"])
@@ -1,9 +1,11 @@
 import logging
 import asyncio
+import traceback
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Tuple
 
 import aiohttp
+import orjson
 
 from .transport import JanusTransport
 
@@ -11,36 +13,109 @@ from .transport import JanusTransport
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Python 3.7 compatible equivalent of @dataclass(slots=True)
+@dataclass(frozen=True)
 class ReceiverTask:
+    __slots__ = ("task", "destroyed_event")
+
     task: asyncio.Task
     destroyed_event: asyncio.Event
 
 
 class JanusTransportHTTP(JanusTransport):
-    """Janus transport through HTTP"""
+    """Janus transport through HTTP
+
+    Every message costs one HTTP round-trip. Use a websocket base_url to
+    multiplex all transactions over one connection instead.
+    """
 
     __receive_response_task_map: Dict[int, ReceiverTask]
-    __api_secret: str
-    __token: str
+    __long_poll_params: Dict[str, str]
+    __url_cache: Dict[Tuple[int, int], str]
+    __http_session: aiohttp.ClientSession
+    __long_poll_session: aiohttp.ClientSession
+    __keepalive_timeout: float
 
     def __init__(
-        self, base_url: str, api_secret: str = None, token: str = None, **kwargs: dict
+        self,
+        base_url: str,
+        api_secret: str = None,
+        token: str = None,
+        keepalive_timeout: float = 75,
+        **kwargs: dict,
     ):
-        super().__init__(base_url=base_url, api_secret=api_secret, token=token)
+        """Create HTTP transport instance
+
+        :param keepalive_timeout: (optional) Seconds to keep idle connections
+            in the pool. Lower it for servers that reap idle connections early.
+        """
+        super().__init__(
+            base_url=base_url, api_secret=api_secret, token=token, **kwargs
+        )
 
         self.__receive_response_task_map = dict()
         # HTTP transport needs these for long polling
-        self.__api_secret = api_secret
-        self.__token = token
+        self.__long_poll_params = dict()
+        if api_secret:
+            self.__long_poll_params["apisecret"] = api_secret
+        if token:
+            self.__long_poll_params["token"] = token
+        self.__url_cache = dict()
+        self.__http_session = None
+        self.__long_poll_session = None
+        self.__keepalive_timeout = keepalive_timeout
 
     async def _connect(self):
-        pass
+        # One client session for all requests, so the keep-alive
+        # connections in its pool are reused instead of re-handshaking
+        self.__http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                # Outlive the idle gaps between Janus long-polls
+                keepalive_timeout=self.__keepalive_timeout,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=300,
+            )
+        )
+        # Every Janus session holds a long-poll open at all times. Give them
+        # their own unlimited pool so they can never starve the requests.
+        self.__long_poll_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=0,
+                keepalive_timeout=self.__keepalive_timeout,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=300,
+            )
+        )
+
+        # Resume long-polls of sessions that outlived a disconnect
+        for session_id in list(self.__receive_response_task_map):
+            await self.dispatch_session_created(session_id=session_id)
 
     async def _disconnect(self):
-        pass
+        # Stop the long-polls first because they are using the client session.
+        # Keep the sessions in the map so that reconnecting resumes them.
+        receiver_tasks = list(self.__receive_response_task_map.values())
+        for receiver_task in receiver_tasks:
+            receiver_task.destroyed_event.set()
+        if receiver_tasks:
+            await asyncio.wait([receiver_task.task for receiver_task in receiver_tasks])
+
+        # Closes the owned connector too. Yield once so the closed
+        # transports can run their connection_lost callbacks.
+        await self.__http_session.close()
+        await self.__long_poll_session.close()
+        await asyncio.sleep(0)
+        self.__http_session = None
+        self.__long_poll_session = None
 
     def __build_url(self, session_id: int = None, handle_id: int = None) -> str:
+        key = (session_id, handle_id)
+        url = self.__url_cache.get(key)
+        if url is not None:
+            return url
+
         url = f"{self.base_url}"
 
         if session_id:
@@ -49,12 +124,31 @@ class JanusTransportHTTP(JanusTransport):
             if handle_id:
                 url = f"{url}/{handle_id}"
 
+        self.__url_cache[key] = url
         return url
 
+    async def __get_http_session(self) -> aiohttp.ClientSession:
+        # Requests don't need an explicit connect, same as plain HTTP
+        if self.__http_session is None:
+            await self.connect()
+
+        return self.__http_session
+
     async def info(self) -> Dict:
-        async with aiohttp.ClientSession() as http_session:
-            async with http_session.get(f"{self.base_url}/info") as response:
-                return await response.json()
+        http_session = await self.__get_http_session()
+        async with http_session.get(f"{self.base_url}/info") as response:
+            return orjson.loads(await response.read())
+
+    async def __post(self, url: str, data: bytes) -> Dict:
+        http_session = await self.__get_http_session()
+        async with http_session.post(
+            url=url,
+            data=data,
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+
+            return orjson.loads(await response.read())
 
     async def _send(
         self,
@@ -62,73 +156,69 @@ class JanusTransportHTTP(JanusTransport):
     ) -> None:
         session_id = message.get("session_id")
         handle_id = message.get("handle_id")
+        url = self.__build_url(session_id=session_id, handle_id=handle_id)
+        data = orjson.dumps(message)
 
-        async with aiohttp.ClientSession() as http_session:
-            async with http_session.post(
-                url=self.__build_url(session_id=session_id, handle_id=handle_id),
-                json=message,
-            ) as response:
-                response.raise_for_status()
-
-                response_dict = await response.json()
-
-                # if "error" in response_dict:
-                #     raise Exception(response_dict)
-
-                # # There must be a transaction ID
-                # response_transaction_id = response_dict["transaction"]
-
-                # Fake receive
-                # # We will immediately get a response in the HTTP response, so need
-                # # to put this into the queue
-                # await self.put_response(
-                #     transaction_id=response_transaction_id, response=response_dict
-                # )
-                await self.receive(response=response_dict)
+        try:
+            response_dict = await self.__post(url=url, data=data)
+        except aiohttp.ClientConnectorError as err:
+            # Retry once only if the connection could not be established. Then
+            # the server never saw the request, so it can't be applied twice.
+            logger.warning("Retrying request after connection error: %s", err)
+            await asyncio.sleep(0.1)
+            response_dict = await self.__post(url=url, data=data)
+
+        # The HTTP response is the synchronous reply. Route it like any
+        # other message because asynchronous events of the same
+        # transaction still arrive through the long-poll.
+        await self.receive(response=response_dict)
 
     def session_receive_response_done_cb(
         self, task: asyncio.Task, context=None
     ) -> None:
         try:
             # Check if any exceptions are raised
-            task.exception()
+            # If it's CancelledError or InvalidStateError exception then they will be raised
+            # else the exception in task will be returned
+            exception = task.exception()
+            if exception:
+                logger.error(
+                    "".join(
+                        traceback.format_exception(
+                            type(exception),
+                            value=exception,
+                            tb=exception.__traceback__,
+                        )
+                    )
+                )
         except asyncio.CancelledError:
             logger.info("Receive message task ended")
         except asyncio.InvalidStateError:
             logger.info("receive_message_done_cb called with invalid state")
-        except Exception as err:
-            logger.error(err)
 
     async def session_receive_response(
         self, session_id: str, destroyed_event: asyncio.Event
     ) -> None:
-        url_params = {}
-        if self.__api_secret:
-            url_params["apisecret"] = self.__api_secret
-        if self.__token:
-            url_params["token"] = self.__token
-
-        async with aiohttp.ClientSession() as http_session:
-            while not destroyed_event.is_set():
-                async with http_session.get(
-                    url=self.__build_url(session_id=session_id),
-                    params=url_params,
-                ) as response:
-                    # Maybe session is destroyed during http request
-                    if destroyed_event.is_set():
-                        break
+        while not destroyed_event.is_set():
+            async with self.__long_poll_session.get(
+                url=self.__build_url(session_id=session_id),
+                params=self.__long_poll_params,
+            ) as response:
+                # Maybe session is destroyed during http request
+                if destroyed_event.is_set():
+                    break
 
-                    response.raise_for_status()
+                response.raise_for_status()
 
-                    response_dict = await response.json()
+                response_dict = orjson.loads(await response.read())
 
-                    if "error" in response_dict:
-                        raise Exception(response_dict)
+                if "error" in response_dict:
+                    raise Exception(response_dict)
 
-                    if response_dict["janus"] == "keepalive":
-                        continue
+                if response_dict["janus"] == "keepalive":
+                    continue
 
-                    await self.receive(response=response_dict)
+                await self.receive(response=response_dict)
 
     async def dispatch_session_created(self, session_id: str) -> None:
         logger.info(f"Create session_receive_response task ({session_id})")
@@ -144,11 +234,14 @@ class JanusTransportHTTP(JanusTransport):
         )
 
     async def dispatch_session_destroyed(self, session_id: int) -> None:
-        if session_id not in self.__receive_response_task_map:
-            logger.warn(f"Session receive response task not found for {session_id}")
+        receiver_task = self.__receive_response_task_map.pop(session_id, None)
+        if receiver_task is None:
+            logger.warning(
+                "Session receive response task not found for %s", session_id
+            )
+            return
 
         logger.info(f"Destroy session_receive_response task ({session_id})")
-        receiver_task = self.__receive_response_task_map[session_id]
         # Don't use task.cancel() to avoid
         # Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000027A269465F0>
         receiver_task.destroyed_event.set()
@@ -157,6 +250,10 @@ class JanusTransportHTTP(JanusTransport):
         # wait for the long-poll request to complete
         await asyncio.wait([receiver_task.task])
 
+        # Forget URLs of this session and its plugin handles
+        for key in [key for key in self.__url_cache if key[0] == session_id]:
+            del self.__url_cache[key]
+
 
 def protocol_matcher(base_url: str):
     return base_url.startswith(("http://", "https://"))
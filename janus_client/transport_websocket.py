@@ -1,9 +1,9 @@
 import logging
 from typing import Any
 import asyncio
-import json
 import traceback
 
+import orjson
 import websockets
 
 from .transport import JanusTransport
@@ -98,7 +98,7 @@ class JanusTransportWebsocket(JanusTransport):
             raise Exception("Not connected to server.")
 
         async for message_raw in self.ws:
-            response = json.loads(message_raw)
+            response = orjson.loads(message_raw)
 
             await self.receive(response)
 
@@ -112,7 +112,8 @@ class JanusTransportWebsocket(JanusTransport):
         if not self.receiving_message:
             raise Exception("Websocket not receiving message")
 
-        await self.ws.send(json.dumps(message))
+        # Decode to keep sending text frames
+        await self.ws.send(orjson.dumps(message).decode())
 
 
 def protocol_matcher(base_url: str):
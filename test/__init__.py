@@ -0,0 +1,9 @@
+import logging
+import os
+
+# Set JANUS_LOG_LEVEL=INFO or DEBUG to see the exchanged messages
+logging.basicConfig(
+    format="%(asctime)s: %(message)s",
+    level=os.environ.get("JANUS_LOG_LEVEL", "WARNING").upper(),
+    datefmt="%H:%M:%S",
+)
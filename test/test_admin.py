@@ -1,12 +1,9 @@
 import unittest
 import logging
-import asyncio
 
 from janus_client import JanusAdminMonitorClient
 from test.util import async_test
 
-format = "%(asctime)s: %(message)s"
-logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
 logger = logging.getLogger()
 
 
@@ -24,9 +21,6 @@ class BaseTestClass:
 
         async def asyncTearDown(self) -> None:
             await self.admin_client.disconnect()
-            # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
-            # Working around to avoid "Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000024A04C60280>"
-            await asyncio.sleep(0.250)
 
         @async_test
         async def test_sanity(self):
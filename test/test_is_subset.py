@@ -3,8 +3,6 @@ import logging
 
 from janus_client.message_transaction import is_subset
 
-format = "%(asctime)s: %(message)s"
-logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
 logger = logging.getLogger()
 
 
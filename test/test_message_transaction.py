@@ -0,0 +1,81 @@
+import unittest
+import asyncio
+
+from janus_client.message_transaction import MessageTransaction
+from test.util import async_test
+
+
+class TestClass(unittest.TestCase):
+    @async_test
+    async def test_sanity(self):
+        """Sanity test"""
+        transaction = MessageTransaction(transaction_id="abc")
+        self.assertEqual(transaction.id, "abc")
+
+        transaction.put_msg({"janus": "ack"})
+        response = await transaction.get(timeout=1)
+        self.assertEqual(response, {"janus": "ack"})
+
+    @async_test
+    async def test_skip_earlier_messages(self):
+        transaction = MessageTransaction(transaction_id="abc")
+        transaction.put_msg({"janus": "ack"})
+
+        async def put_later():
+            await asyncio.sleep(0.01)
+            transaction.put_msg({"janus": "ack", "again": True})
+            await asyncio.sleep(0.01)
+            transaction.put_msg({"janus": "event", "data": 1})
+
+        asyncio.create_task(put_later())
+        response = await transaction.get({"janus": "event"}, timeout=1)
+        self.assertEqual(response, {"janus": "event", "data": 1})
+
+        # Skipped messages are still available
+        response = await transaction.get({"janus": "ack"}, timeout=1)
+        self.assertEqual(response, {"janus": "ack"})
+
+    @async_test
+    async def test_concurrent_get(self):
+        transaction = MessageTransaction(transaction_id="abc")
+
+        get_event = asyncio.create_task(
+            transaction.get({"janus": "event"}, timeout=1)
+        )
+        get_ack = asyncio.create_task(transaction.get({"janus": "ack"}, timeout=1))
+        get_success = asyncio.create_task(
+            transaction.get(lambda msg: msg["janus"] == "success", timeout=1)
+        )
+        await asyncio.sleep(0)
+
+        transaction.put_msg({"janus": "ack"})
+        await asyncio.sleep(0.01)
+        transaction.put_msg({"janus": "event"})
+        transaction.put_msg({"janus": "success"})
+
+        response_event, response_ack, response_success = await asyncio.gather(
+            get_event, get_ack, get_success
+        )
+        self.assertEqual(response_event, {"janus": "event"})
+        self.assertEqual(response_ack, {"janus": "ack"})
+        self.assertEqual(response_success, {"janus": "success"})
+
+    @async_test
+    async def test_timeout(self):
+        transaction = MessageTransaction(transaction_id="abc")
+        transaction.put_msg({"janus": "ack"})
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await transaction.get({"janus": "event"}, timeout=0.05)
+
+        # The transaction still works after a timed out get()
+        transaction.put_msg({"janus": "event"})
+        response = await transaction.get({"janus": "event"}, timeout=1)
+        self.assertEqual(response, {"janus": "event"})
+
+    @async_test
+    async def test_invalid_matcher(self):
+        transaction = MessageTransaction(transaction_id="abc")
+
+        with self.assertRaises(TypeError):
+            await transaction.get(matcher="ack")
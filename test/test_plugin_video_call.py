@@ -12,8 +12,6 @@ from janus_client import (
 )
 from test.util import async_test
 
-format = "%(asctime)s: %(message)s"
-logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
 logger = logging.getLogger()
 
 
@@ -29,9 +27,6 @@ class BaseTestClass:
 
         async def asyncTearDown(self) -> None:
             await self.transport.disconnect()
-            # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
-            # Working around to avoid "Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000024A04C60280>"
-            await asyncio.sleep(0.250)
 
         @async_test
         async def test_sanity(self):
@@ -138,10 +133,15 @@ class BaseTestClass:
 
             async def on_incoming_call(plugin: JanusVideoCallPlugin, jsep: dict):
                 # player = MediaPlayer("./Into.the.Wild.2007.mp4")
-                player = MediaPlayer(
-                    "http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4"
+                # Opening media blocks, so keep it off the event loop
+                player = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    MediaPlayer,
+                    "http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4",
+                )
+                recorder = await asyncio.get_running_loop().run_in_executor(
+                    None, MediaRecorder, output_filename_in
                 )
-                recorder = MediaRecorder(output_filename_in)
                 pc = await plugin.create_pc(
                     player=player,
                     recorder=recorder,
@@ -173,11 +173,15 @@ class BaseTestClass:
             #         "offset_y": "30",
             #     },
             # )
-            player = MediaPlayer(
-                "http://download.tsi.telecom-paristech.fr/gpac/dataset/dash/uhd/mux_sources/hevcds_720p30_2M.mp4"
+            player = await asyncio.get_running_loop().run_in_executor(
+                None,
+                MediaPlayer,
+                "http://download.tsi.telecom-paristech.fr/gpac/dataset/dash/uhd/mux_sources/hevcds_720p30_2M.mp4",
             )
             # player = MediaPlayer("../Into.the.Wild.2007.mp4")
-            recorder = MediaRecorder(output_filename_out)
+            recorder = await asyncio.get_running_loop().run_in_executor(
+                None, MediaRecorder, output_filename_out
+            )
 
             call_result = await plugin_handle_out.call(
                 username=username_in, player=player, recorder=recorder
@@ -13,8 +13,6 @@ from janus_client import (
 )
 from test.util import async_test
 
-format = "%(asctime)s: %(message)s"
-logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
 logger = logging.getLogger()
 
 
@@ -30,9 +28,6 @@ class BaseTestClass:
 
         async def asyncTearDown(self) -> None:
             await self.transport.disconnect()
-            # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
-            # Working around to avoid "Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000024A04C60280>"
-            await asyncio.sleep(0.250)
 
         @async_test
         async def test_create_edit_destroy(self):
@@ -287,8 +282,11 @@ class BaseTestClass:
                 self.assertTrue(response)
 
                 # player = MediaPlayer("./Into.the.Wild.2007.mp4")
-                player = MediaPlayer(
-                    "http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4"
+                # Opening media blocks, so keep it off the event loop
+                player = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    MediaPlayer,
+                    "http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4",
                 )
                 response = await plugin.publish(stream_track=player.stream_tracks)
                 self.assertTrue(response)
@@ -346,8 +344,10 @@ class BaseTestClass:
             # self.assertTrue(response)
 
             # player = MediaPlayer("./Into.the.Wild.2007.mp4")
-            player = MediaPlayer(
-                "http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4"
+            player = await asyncio.get_running_loop().run_in_executor(
+                None,
+                MediaPlayer,
+                "http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/BigBuckBunny.mp4",
             )
             response = await plugin_publish.publish(stream_track=player.stream_tracks)
             self.assertTrue(response)
@@ -360,7 +360,9 @@ class BaseTestClass:
             output_filename_out = "./video_room_record_out.mp4"
             if os.path.exists(output_filename_out):
                 os.remove(output_filename_out)
-            recorder = MediaRecorder(output_filename_out)
+            recorder = await asyncio.get_running_loop().run_in_executor(
+                None, MediaRecorder, output_filename_out
+            )
 
             async def on_track_created(track):
                 logger.info("Track %s received" % track.kind)
@@ -380,6 +382,8 @@ class BaseTestClass:
 
             await asyncio.sleep(30)
 
+            # Keep the teardown sequential: the subscriber is on the feed being
+            # unpublished, and the recorder must stop before that feed is gone.
             response = await plugin_subscribe.unsubscribe()
             self.assertTrue(response)
 
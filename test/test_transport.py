@@ -1,12 +1,14 @@
 import unittest
 import logging
 import asyncio
+import itertools
+
+import aiohttp
+from aiohttp import web
 
 from janus_client import JanusTransport, JanusSession
 from test.util import async_test
 
-format = "%(asctime)s: %(message)s"
-logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
 logger = logging.getLogger()
 
 
@@ -22,9 +24,6 @@ class BaseTestClass:
 
         async def asyncTearDown(self) -> None:
             await self.transport.disconnect()
-            # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
-            # Working around to avoid "Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000024A04C60280>"
-            await asyncio.sleep(0.250)
 
         @async_test
         async def test_sanity(self):
@@ -77,3 +76,238 @@ class TestTransportHttps(BaseTestClass.TestClass):
 
 class TestTransportWebsocketSecure(BaseTestClass.TestClass):
     server_url = "wss://janusmy.josephgetmyip.com/janusbasews/janus"
+
+
+class TestTransportHttpLocal(unittest.TestCase):
+    """Exercise JanusTransportHTTP against a local fake Janus server"""
+
+    session_id = 1234
+
+    async def handle_post(self, request: web.Request) -> web.Response:
+        message = await request.json()
+        self.received.append(message)
+
+        if self.drop_connection:
+            # Request is handled but the response is lost
+            request.transport.close()
+
+        response = {"transaction": message["transaction"]}
+        if message["janus"] == "ping":
+            response["janus"] = self.ping_reply
+        elif message["janus"] == "create":
+            response.update(janus="success", data={"id": next(self.session_ids)})
+        elif message["janus"] == "destroy":
+            response.update(janus="success", session_id=message["session_id"])
+        else:
+            response.update(janus="ack", session_id=message.get("session_id"))
+
+        return web.json_response(response)
+
+    async def handle_info(self, request: web.Request) -> web.Response:
+        return web.json_response({"janus": "server_info"})
+
+    async def handle_long_poll(self, request: web.Request) -> web.Response:
+        self.long_poll_params.append(dict(request.query))
+        try:
+            await asyncio.wait_for(
+                self.long_poll_released.wait(), timeout=self.long_poll_timeout
+            )
+        except asyncio.TimeoutError:
+            pass
+        return web.json_response({"janus": "keepalive"})
+
+    async def start_server(self, port: int = 0) -> int:
+        app = web.Application()
+        app.router.add_post("/janus", self.handle_post)
+        app.router.add_get("/janus/info", self.handle_info)
+        app.router.add_post("/janus/{session_id}", self.handle_post)
+        app.router.add_get("/janus/{session_id}", self.handle_long_poll)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", port)
+        await site.start()
+        return self.runner.addresses[0][1]
+
+    async def asyncSetUp(self) -> None:
+        self.received = []
+        self.long_poll_params = []
+        self.session_ids = itertools.count(self.session_id)
+        self.long_poll_timeout = 0.1
+        self.long_poll_released = asyncio.Event()
+        self.drop_connection = False
+        self.ping_reply = "pong"
+
+        self.port = await self.start_server()
+
+        self.transport = JanusTransport.create_transport(
+            base_url=f"http://127.0.0.1:{self.port}/janus", api_secret="janusrocks"
+        )
+        await self.transport.connect()
+
+    async def asyncTearDown(self) -> None:
+        await self.transport.disconnect()
+        await self.runner.cleanup()
+
+    async def assertTransactionReleased(self, transaction_id: str) -> None:
+        # A released transaction no longer takes its replies
+        with self.assertLogs("janus_client.transport", level="INFO") as logs:
+            await self.transport.receive(
+                {"janus": "ack", "transaction": transaction_id}
+            )
+        self.assertIn("Response dropped", logs.output[-1])
+
+    @async_test
+    async def test_send(self):
+        await self.asyncSetUp()
+
+        message_transaction = await self.transport.send({"janus": "ping"})
+        response = await message_transaction.get(timeout=5)
+        await message_transaction.done()
+
+        self.assertEqual(response["janus"], "pong")
+        self.assertEqual(response["transaction"], message_transaction.id)
+        self.assertEqual(self.received[0]["transaction"], message_transaction.id)
+        self.assertEqual(self.received[0]["apisecret"], "janusrocks")
+
+        await self.asyncTearDown()
+
+    @async_test
+    async def test_session(self):
+        await self.asyncSetUp()
+
+        session = JanusSession(transport=self.transport)
+
+        message_transaction = await session.send(
+            {"janus": "keepalive"},
+        )
+        response = await message_transaction.get({"janus": "ack"}, timeout=5)
+        await message_transaction.done()
+        self.assertEqual(response["janus"], "ack")
+        self.assertEqual(self.received[-1]["session_id"], self.session_id)
+
+        await session.destroy()
+
+        self.assertEqual(self.received[-1]["janus"], "destroy")
+        self.assertEqual(self.long_poll_params[0], {"apisecret": "janusrocks"})
+
+        await self.asyncTearDown()
+
+    @async_test
+    async def test_request_without_connect(self):
+        await self.asyncSetUp()
+        await self.transport.disconnect()
+
+        # Connects on demand
+        response = await self.transport.info()
+        self.assertEqual(response["janus"], "server_info")
+
+        message_transaction = await self.transport.send({"janus": "ping"})
+        response = await message_transaction.get(timeout=5)
+        await message_transaction.done()
+        self.assertEqual(response["janus"], "pong")
+
+        await self.asyncTearDown()
+
+    @async_test
+    async def test_disconnect_with_session(self):
+        await self.asyncSetUp()
+
+        with self.assertLogs("janus_client.transport_http", level="INFO") as logs:
+            session = JanusSession(transport=self.transport)
+            await session.create()
+
+            # Long-poll must be stopped before the client session is closed
+            await self.transport.disconnect()
+            # Give a leftover long-poll the chance to fail
+            await asyncio.sleep(0.2)
+
+        self.assertFalse(self.transport.connected)
+        self.assertFalse([log for log in logs.output if log.startswith("ERROR")])
+
+        # The session outlives the disconnect and can still be destroyed
+        long_poll_count = len(self.long_poll_params)
+        await session.destroy()
+
+        self.assertEqual(self.received[-1]["janus"], "destroy")
+        # Reconnecting resumed its long-poll
+        self.assertGreater(len(self.long_poll_params), long_poll_count)
+        self.assertFalse(self.transport.connected)
+
+        await self.asyncTearDown()
+
+    @async_test
+    async def test_many_sessions(self):
+        """Long-polls of all sessions must not block requests"""
+        await self.asyncSetUp()
+
+        # Janus holds a long-poll until there is an event
+        self.long_poll_timeout = 30
+
+        sessions = [JanusSession(transport=self.transport) for _ in range(17)]
+        for session in sessions:
+            await session.create()
+
+        message_transaction = await asyncio.wait_for(
+            sessions[0].send({"janus": "keepalive"}), timeout=5
+        )
+        response = await message_transaction.get({"janus": "ack"}, timeout=5)
+        await message_transaction.done()
+        self.assertEqual(response["janus"], "ack")
+
+        self.long_poll_released.set()
+        await asyncio.gather(*[session.destroy() for session in sessions])
+
+        await self.asyncTearDown()
+
+    @async_test
+    async def test_retry_connect_error(self):
+        """Retry when the connection could not be established"""
+        await self.asyncSetUp()
+
+        await self.runner.cleanup()
+
+        async def restart_server():
+            await asyncio.sleep(0.02)
+            await self.start_server(port=self.port)
+
+        restart_task = asyncio.create_task(restart_server())
+
+        message_transaction = await self.transport.send({"janus": "ping"})
+        response = await message_transaction.get(timeout=5)
+        await message_transaction.done()
+        await restart_task
+
+        self.assertEqual(response["janus"], "pong")
+        self.assertEqual(len(self.received), 1)
+
+        await self.asyncTearDown()
+
+    @async_test
+    async def test_no_retry_after_request_sent(self):
+        """Don't retry once the server may have handled the request"""
+        await self.asyncSetUp()
+
+        self.drop_connection = True
+
+        with self.assertRaises(aiohttp.ServerDisconnectedError):
+            await self.transport.send({"janus": "create"})
+
+        self.assertEqual(len(self.received), 1)
+        await self.assertTransactionReleased(self.received[0]["transaction"])
+
+        await self.asyncTearDown()
+
+    @async_test
+    async def test_request_timeout(self):
+        """A request without the expected reply times out and is released"""
+        await self.asyncSetUp()
+
+        self.ping_reply = "ack"
+        self.transport.request_timeout = 0.2
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.transport.ping()
+
+        await self.assertTransactionReleased(self.received[-1]["transaction"])
+
+        await self.asyncTearDown()
@@ -1,4 +1,10 @@
 import asyncio
+import sys
+
+if sys.platform == "win32":
+    # Proactor loop complains about transports closed after the loop
+    # "Exception ignored in: <function _ProactorBasePipeTransport.__del__ ...>"
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
 def async_test(coro):